@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import List, Optional, Set, Tuple
+from typing import Any, List, Optional, Sequence, Set, Tuple
 
 import pandas as pd
 import psutil
@@ -115,3 +115,16 @@ def format_df_for_printout(
     finally:
         tabulate.PRESERVE_WHITESPACE = original_preserve_whitespace
     return formatted_df
+
+
+def format_rows_for_printout(rows: List[Sequence[Any]], headers: Sequence[str], table_format: ClientConfigEnum) -> str:
+    """
+    Renders rows the same way format_df_for_printout renders a DataFrame, without building one
+    """
+    original_preserve_whitespace = tabulate.PRESERVE_WHITESPACE
+    tabulate.PRESERVE_WHITESPACE = True
+    try:
+        formatted_rows = tabulate.tabulate(rows, tablefmt=table_format, headers=headers)
+    finally:
+        tabulate.PRESERVE_WHITESPACE = original_preserve_whitespace
+    return formatted_rows
@@ -1,7 +1,8 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
+import ujson
 from bidict import bidict
 
 import hummingbot.connector.derivative.okx_perpetual.okx_perpetual_constants as CONSTANTS
@@ -35,12 +36,35 @@ if TYPE_CHECKING:
 
 s_decimal_NaN = Decimal("nan")
 s_decimal_0 = Decimal(0)
+s_decimal_neg_one = Decimal(-1)
+
+# Request parameters shared by every call, never mutated since RESTAssistant deep copies each request
+_SWAP_PARAMS = {"instType": "SWAP"}
+
+# (trade type, position action) -> (order side, position side when in hedge mode)
+_ORDER_SIDE_AND_HEDGE_POSITION_SIDE = {
+    (TradeType.BUY, PositionAction.OPEN): ("buy", "long"),
+    (TradeType.SELL, PositionAction.OPEN): ("sell", "short"),
+    (TradeType.BUY, PositionAction.CLOSE): ("buy", "short"),
+    (TradeType.SELL, PositionAction.CLOSE): ("sell", "long"),
+}
+
+# Anything other than "long" (including one-way mode "net") has always been treated as short here
+_POS_SIDE_MAP = {"long": PositionSide.LONG, "short": PositionSide.SHORT}
 
 
 class OkxPerpetualDerivative(PerpetualDerivativePyBase):
 
     web_utils = web_utils
 
+    # OKX reports requests signed with a drifted timestamp as an invalid signature
+    _TIME_SYNCHRONIZER_ERROR_CODE = f'"code":"{CONSTANTS.RET_CODE_INVALID_SIGNATURE}"'
+    _PLACE_ORDER_PATH = CONSTANTS.REST_PLACE_ACTIVE_ORDER[CONSTANTS.ENDPOINT]
+    _CANCEL_ORDER_PATH = CONSTANTS.REST_CANCEL_ACTIVE_ORDER[CONSTANTS.ENDPOINT]
+    _QUERY_ORDER_PATH = CONSTANTS.REST_QUERY_ACTIVE_ORDER[CONSTANTS.ENDPOINT]
+    # Shared between requests, RESTAssistant copies the headers into a new dict before adding its own
+    _HEADERS_REFERER = {"referer": CONSTANTS.HBOT_BROKER_ID}
+
     def __init__(
         self,
         client_config_map: "ClientConfigAdapter",
@@ -60,9 +84,20 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         self._domain = domain
         self._last_trade_history_timestamp = None
         self._contract_sizes = {}
+        self._symbol_cache: Dict[str, str] = {}
+        self._symbol_to_trading_pair: Dict[str, str] = {}
+        # The domain never changes for a connector instance, so the URL and limit id per endpoint are fixed
+        self._rest_url_by_path: Dict[str, str] = {}
+        self._limit_id_by_method_and_path: Dict[Tuple[str, str], str] = {}
 
         super().__init__(client_config_map)
 
+        self._user_stream_event_handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            CONSTANTS.WS_POSITIONS_CHANNEL: self._process_account_position_event,
+            CONSTANTS.WS_ORDERS_CHANNEL: self._process_order_event_message,
+            CONSTANTS.WS_ACCOUNT_CHANNEL: self._process_wallet_event_message,
+        }
+
     @property
     def authenticator(self) -> OkxPerpetualAuth:
         return OkxPerpetualAuth(self.okx_perpetual_api_key,
@@ -135,9 +170,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         return [PositionMode.ONEWAY, PositionMode.HEDGE]
 
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
-        error_description = str(request_exception)
-        is_time_synchronizer_related = '"code":"50113"' in error_description
-        return is_time_synchronizer_related
+        return self._TIME_SYNCHRONIZER_ERROR_CODE in str(request_exception)
 
     def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
         # TODO: implement this method correctly for the connector
@@ -154,8 +187,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         return False
 
     async def _make_trading_pairs_request(self) -> Any:
-        params = {"instType": "SWAP"}
-        exchange_info = await self._api_get(path_url=self.trading_pairs_request_path, params=params)
+        exchange_info = await self._api_get(path_url=self.trading_pairs_request_path, params=_SWAP_PARAMS)
         return exchange_info
 
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
@@ -223,7 +255,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         try:
             exchange_info = await self._api_get(
                 path_url=self.trading_pairs_request_path,
-                params={"instType": "SWAP"},
+                params=_SWAP_PARAMS,
             )
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
@@ -240,33 +272,29 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         position_action: PositionAction = PositionAction.NIL,
         **kwargs,
     ) -> Tuple[str, float]:
-        if position_action == PositionAction.NIL:
+        try:
+            side, hedge_position_side = _ORDER_SIDE_AND_HEDGE_POSITION_SIDE[(trade_type, position_action)]
+        except KeyError:
             raise NotImplementedError
-        ex_trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair)
+        ex_trading_pair = self._exchange_symbol_for_pair(trading_pair)
         data = {
             "clOrdId": order_id,
             "tdMode": "cross",
             "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
             "instId": ex_trading_pair,
-            "side": "buy" if trade_type.name == "BUY" else "sell",
+            "side": side,
             "sz": str(self._format_amount_to_size(trading_pair, amount)),
         }
         if order_type.is_limit_type():
             data["px"] = str(price)
-        if self.position_mode == PositionMode.HEDGE:
-            if position_action == PositionAction.OPEN:
-                data["posSide"] = "long" if trade_type is TradeType.BUY else "short"
-            else:
-                data["posSide"] = "short" if trade_type is TradeType.BUY else "long"
-        else:
-            data["posSide"] = "net"
+        data["posSide"] = hedge_position_side if self.position_mode == PositionMode.HEDGE else "net"
 
         exchange_order_id = await self._api_post(
-            path_url=CONSTANTS.REST_PLACE_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
+            path_url=self._PLACE_ORDER_PATH,
             data=data,
             is_auth_required=True,
             trading_pair=ex_trading_pair,
-            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+            headers=self._HEADERS_REFERER,
             **kwargs,
         )
 
@@ -276,13 +304,13 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         return str(data["ordId"]), self.current_timestamp
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
-        data = {"instId": await self.exchange_symbol_associated_to_pair(tracked_order.trading_pair)}
+        data = {"instId": self._exchange_symbol_for_pair(tracked_order.trading_pair)}
         if tracked_order.exchange_order_id:
             data["ordId"] = tracked_order.exchange_order_id
         if tracked_order.client_order_id:
             data["clOrdId"] = tracked_order.client_order_id
         cancel_result = await self._api_post(
-            path_url=CONSTANTS.REST_CANCEL_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
+            path_url=self._CANCEL_ORDER_PATH,
             data=data,
             is_auth_required=True,
             trading_pair=tracked_order.trading_pair,
@@ -309,11 +337,9 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         return price
 
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
-        params = {"instType": "SWAP"}
-
         resp_json = await self._api_get(
             path_url=CONSTANTS.REST_LATEST_SYMBOL_INFORMATION[CONSTANTS.ENDPOINT],
-            params=params,
+            params=_SWAP_PARAMS,
         )
 
         last_traded_prices = {ticker["instId"].replace("-SWAP", ""): float(ticker["last"]) for ticker in resp_json["data"]}
@@ -358,7 +384,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         exchange_info = await self._api_get(
             path_url=self.trading_rules_request_path,
             is_auth_required=False,
-            params={"instType": "SWAP"},
+            params=_SWAP_PARAMS,
         )
         trading_rules_list = await self._format_trading_rules(exchange_info)
         self._trading_rules.clear()
@@ -376,23 +402,16 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         for rule in instrument_info_dict["data"]:
             try:
                 if okx_utils.is_exchange_information_valid(rule):
-                    trading_pair = combine_to_hb_trading_pair(rule['ctValCcy'], rule['settleCcy'])
+                    collateral_token = rule["settleCcy"]
+                    trading_pair = combine_to_hb_trading_pair(rule["ctValCcy"], collateral_token)
+                    # OKX delivers all numeric fields as strings, so each one is parsed exactly once
                     contract_size = Decimal(rule["ctVal"])
                     self._contract_sizes[trading_pair] = contract_size
-                    minimum_order_quantity = Decimal(rule["minSz"])
-                    min_order_size = minimum_order_quantity * contract_size
-
-                    min_price_increment = Decimal(rule["tickSz"])
-
-                    lot_size = Decimal(rule["lotSz"])
-                    min_base_amount_increment = lot_size * contract_size
-
-                    collateral_token = rule["settleCcy"]
                     trading_rules[trading_pair] = TradingRule(
                         trading_pair=trading_pair,
-                        min_order_size=Decimal(str(min_order_size)),
-                        min_price_increment=Decimal(str(min_price_increment)),
-                        min_base_amount_increment=Decimal(str(min_base_amount_increment)),
+                        min_order_size=Decimal(rule["minSz"]) * contract_size,
+                        min_price_increment=Decimal(rule["tickSz"]),
+                        min_base_amount_increment=Decimal(rule["lotSz"]) * contract_size,
                         buy_order_collateral_token=collateral_token,
                         sell_order_collateral_token=collateral_token,
                     )
@@ -404,7 +423,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         pass
 
     async def _request_order_fills(self, order: InFlightOrder) -> Dict[str, Any]:
-        exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)
+        exchange_symbol = self._exchange_symbol_for_pair(order.trading_pair)
         body_params = {
             "instType": "SWAP",
             "ordId": order.exchange_order_id,
@@ -443,7 +462,8 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
                            if (tracked_order.trade_type is TradeType.BUY and position_side == "long"
                                or tracked_order.trade_type is TradeType.SELL and position_side == "short")
                            else PositionAction.CLOSE)
-        fill_base_amount = abs(self._format_size_to_amount(tracked_order.trading_pair, (Decimal(str(trade_msg["fillSz"])))))
+        fill_base_amount = abs(self._format_size_to_amount(tracked_order.trading_pair, Decimal(trade_msg["fillSz"])))
+        fill_price = Decimal(trade_msg["fillPx"])
 
         fee = TradeFeeBase.new_perpetual_fee(
             fee_schema=self.trade_fee_schema(),
@@ -459,8 +479,8 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             trading_pair=tracked_order.trading_pair,
             fee=fee,
             fill_base_amount=fill_base_amount,
-            fill_quote_amount=Decimal(trade_msg["fillPx"]) * fill_base_amount,
-            fill_price=Decimal(trade_msg["fillPx"]),
+            fill_quote_amount=fill_price * fill_base_amount,
+            fill_price=fill_price,
             fill_timestamp=int(trade_msg["ts"]) * 1e-3,
         )
         return trade_update
@@ -483,9 +503,9 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
     async def _request_order_update(self, order: InFlightOrder) -> Dict[str, Any]:
         return await self._api_request(
             method=RESTMethod.GET,
-            path_url=CONSTANTS.REST_QUERY_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
+            path_url=self._QUERY_ORDER_PATH,
             params={
-                "instId": await self.exchange_symbol_associated_to_pair(order.trading_pair),
+                "instId": self._exchange_symbol_for_pair(order.trading_pair),
                 "clOrdId": order.client_order_id},
             is_auth_required=True)
 
@@ -497,20 +517,12 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             try:
                 endpoint = web_utils.endpoint_from_message(event_message)
                 payload = web_utils.payload_from_message(event_message)
-                if endpoint == "subscribe":
-                    continue
-                if endpoint == "error":
+                handler = self._user_stream_event_handlers.get(endpoint)
+                if handler is not None:
+                    for message in payload:
+                        handler(message)
+                elif endpoint == "error":
                     self.logger().error(f"Error message received from user stream: {payload}.")
-                    continue
-                if endpoint == CONSTANTS.WS_POSITIONS_CHANNEL:
-                    for position_msg in payload:
-                        await self._process_account_position_event(position_msg)
-                elif endpoint == CONSTANTS.WS_ORDERS_CHANNEL:
-                    for order_msg in payload:
-                        self._process_order_event_message(order_msg)
-                elif endpoint == CONSTANTS.WS_ACCOUNT_CHANNEL:
-                    for wallet_msg in payload:
-                        self._process_wallet_event_message(wallet_msg)
                 elif endpoint is None:
                     self.logger().error(f"Could not extract endpoint from {event_message}.")
                     raise ValueError
@@ -528,111 +540,168 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             self._update_positions(),
         )
 
+    async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        async def request_order_status(order: InFlightOrder) -> Tuple[InFlightOrder, Optional[OrderUpdate], Optional[Exception]]:
+            try:
+                return order, await self._request_order_status(tracked_order=order), None
+            except asyncio.CancelledError:
+                raise
+            except Exception as request_error:
+                return order, None, request_error
+
+        # Process each order update as soon as its response arrives instead of waiting for the slowest one.
+        # Requests still pending when the update is cancelled are cancelled with it
+        request_tasks = [asyncio.ensure_future(request_order_status(order)) for order in orders]
+        try:
+            for next_result in asyncio.as_completed(request_tasks):
+                order, order_update, request_error = await next_result
+                if request_error is None:
+                    self._order_tracker.process_order_update(order_update)
+                else:
+                    await error_handler(order, request_error)
+        finally:
+            for request_task in request_tasks:
+                if not request_task.done():
+                    request_task.cancel()
+
     async def _update_trade_history(self):
         """
         Calls REST API to get trade history (order fills)
         """
+        # OKX returns the fills for every SWAP instrument when no instId is specified
+        limit = 100
+        body_params = {
+            "instType": "SWAP",
+            "limit": limit,
+        }
+        if self._last_trade_history_timestamp:
+            body_params["begin"] = int(int(self._last_trade_history_timestamp) * 1e3)
 
-        trade_history_tasks = []
-
-        for trading_pair in self._trading_pairs:
-            exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair)
-            body_params = {
-                "instId": exchange_symbol,
-                "limit": 100,
-            }
-            if self._last_trade_history_timestamp:
-                body_params["begin"] = int(int(self._last_trade_history_timestamp) * 1e3)
-
-            trade_history_tasks.append(
-                asyncio.create_task(self._api_get(
+        # Fills from other instruments share the page limit, so page through all of them to not skip tracked ones.
+        # Pages are sorted newest first, so each one continues after the oldest bill of the previous page
+        fills: List[Dict[str, Any]] = []
+        page_params = body_params
+        try:
+            while True:
+                resp = await self._api_get(
                     path_url=CONSTANTS.REST_USER_TRADE_RECORDS[CONSTANTS.ENDPOINT],
-                    params=body_params,
+                    params=page_params,
                     is_auth_required=True,
-                    trading_pair=trading_pair,
-                ))
-            )
-
-        raw_responses: List[Dict[str, Any]] = await safe_gather(*trade_history_tasks, return_exceptions=True)
-
-        # Initial parsing of responses. Joining all the responses
-        parsed_history_resps: List[Dict[str, Any]] = []
-        for trading_pair, resp in zip(self._trading_pairs, raw_responses):
-            if not isinstance(resp, Exception):
-                timestamps = [int(trade["ts"]) * 1e-3 for trade in resp["data"]]
-                self._last_trade_history_timestamp = max(timestamps) if timestamps else None
-                entries = resp["data"]
-                if entries:
-                    parsed_history_resps.extend(entries)
-            else:
-                self.logger().network(
-                    f"Error fetching status update for {trading_pair}: {resp}.",
-                    app_warning_msg=f"Failed to fetch status update for {trading_pair}."
                 )
+                page = resp["data"]
+                fills.extend(page)
+                if len(page) < limit:
+                    break
+                page_params = dict(body_params, after=page[-1]["billId"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            self.logger().network(
+                f"Error fetching trade history update: {exception}.",
+                app_warning_msg="Failed to fetch trade history update."
+            )
+            return
+
+        # Fills for orders not tracked by the connector (including other instruments) are discarded here, with a
+        # single snapshot of the fillable orders instead of one per fill
+        fillable_orders = self._order_tracker.all_fillable_orders
+        tracked_fills: List[Tuple[Dict[str, Any], InFlightOrder]] = []
+        last_timestamp_ms = int(self._last_trade_history_timestamp * 1e3) if self._last_trade_history_timestamp else 0
+        for trade in fills:
+            timestamp_ms = int(trade["ts"])
+            if timestamp_ms > last_timestamp_ms:
+                last_timestamp_ms = timestamp_ms
+            fillable_order = fillable_orders.get(trade["clOrdId"])
+            if fillable_order is not None:
+                tracked_fills.append((trade, fillable_order))
+        self._last_trade_history_timestamp = last_timestamp_ms * 1e-3 if last_timestamp_ms else None
 
         # Trade updates must be handled before any order status updates.
-        for trade in parsed_history_resps:
-            self._process_trade_event_message(trade)
+        for trade, fillable_order in tracked_fills:
+            trade_update = self._parse_trade_update(trade_msg=trade, tracked_order=fillable_order)
+            self._order_tracker.process_trade_update(trade_update)
 
     async def _update_positions(self):
         """
         Retrieves all positions using the REST API.
         """
-        position_tasks = []
-
-        for trading_pair in self._trading_pairs:
-            ex_trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair)
-            body_params = {"instId": ex_trading_pair}
-            position_tasks.append(
-                asyncio.create_task(self._api_get(
-                    path_url=CONSTANTS.REST_GET_POSITIONS[CONSTANTS.ENDPOINT],
-                    params=body_params,
-                    is_auth_required=True,
-                    trading_pair=trading_pair,
-                ))
+        if not self._trading_pairs:
+            return
+
+        # A single request without instId returns the positions for every SWAP instrument
+        try:
+            resp = await self._api_get(
+                path_url=CONSTANTS.REST_GET_POSITIONS[CONSTANTS.ENDPOINT],
+                params=_SWAP_PARAMS,
+                is_auth_required=True,
             )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            self.logger().error(f"Error fetching positions. Response: {exception}")
+            return
+
+        tracked_pairs_by_symbol = {
+            self._exchange_symbol_for_pair(trading_pair): trading_pair for trading_pair in self._trading_pairs
+        }
 
-        raw_responses: List[Dict[str, Any]] = await safe_gather(*position_tasks, return_exceptions=True)
-
-        # Initial parsing of responses. Joining all the responses
-        parsed_resps: List[Dict[str, Any]] = []
-        for resp, trading_pair in zip(raw_responses, self._trading_pairs):
-            if not isinstance(resp, Exception):
-                result = resp["data"]
-                if result:
-                    position_entries = result if isinstance(result, list) else [result]
-                    parsed_resps.extend(position_entries)
-            else:
-                self.logger().error(f"Error fetching positions for {trading_pair}. Response: {resp}")
-
-        for data in parsed_resps:
-            ex_trading_pair = data["instId"]
-            hb_trading_pair = await self.trading_pair_associated_to_exchange_symbol(ex_trading_pair)
+        for data in resp["data"]:
+            hb_trading_pair = tracked_pairs_by_symbol.get(data["instId"])
+            if hb_trading_pair is None:
+                continue
             position_side = self.get_position_side(data)
-            unrealized_pnl = Decimal(data["upl"]) if bool(data["upl"]) else Decimal(str(0.0))
-            entry_price = Decimal(data["avgPx"]) if bool(data["avgPx"]) else Decimal(str(0.0))
+            unrealized_pnl = Decimal(data["upl"]) if bool(data["upl"]) else s_decimal_0
+            entry_price = Decimal(data["avgPx"]) if bool(data["avgPx"]) else s_decimal_0
             amount = self.get_position_amount(data)
-            leverage = Decimal(data["lever"]) if bool(data["lever"]) else Decimal(str(0.0))
-            pos_key = self._perpetual_trading.position_key(hb_trading_pair, position_side)
-            if amount != s_decimal_0:
-                position = Position(
-                    trading_pair=hb_trading_pair,
-                    position_side=position_side,
-                    unrealized_pnl=unrealized_pnl,
-                    entry_price=entry_price,
-                    amount=amount * (Decimal("-1.0") if position_side == PositionSide.SHORT else Decimal("1.0")),
-                    leverage=leverage,
-                )
-                self._perpetual_trading.set_position(pos_key, position)
-            else:
-                self._perpetual_trading.remove_position(pos_key)
+            leverage = Decimal(data["lever"]) if bool(data["lever"]) else s_decimal_0
+            self._set_or_remove_position(
+                trading_pair=hb_trading_pair,
+                position_side=position_side,
+                unrealized_pnl=unrealized_pnl,
+                entry_price=entry_price,
+                amount=amount,
+                leverage=leverage,
+            )
+
+    def _set_or_remove_position(self,
+                                trading_pair: str,
+                                position_side: PositionSide,
+                                unrealized_pnl: Decimal,
+                                entry_price: Decimal,
+                                amount: Decimal,
+                                leverage: Decimal):
+        pos_key = self._perpetual_trading.position_key(trading_pair, position_side)
+        if amount == s_decimal_0:
+            self._perpetual_trading.remove_position(pos_key)
+            return
+
+        amount = -amount if position_side == PositionSide.SHORT else amount
+        existing_position = self._perpetual_trading.account_positions.get(pos_key)
+        if existing_position is not None:
+            existing_position.update_position(
+                position_side=position_side,
+                unrealized_pnl=unrealized_pnl,
+                entry_price=entry_price,
+                amount=amount,
+                leverage=leverage,
+            )
+        else:
+            position = Position(
+                trading_pair=trading_pair,
+                position_side=position_side,
+                unrealized_pnl=unrealized_pnl,
+                entry_price=entry_price,
+                amount=amount,
+                leverage=leverage,
+            )
+            self._perpetual_trading.set_position(pos_key, position)
 
     @staticmethod
     def get_position_side(position_msg: Dict[str, Any]) -> PositionSide:
         if position_msg.get("posSide") == "net":
             position_side = PositionSide.LONG if int(position_msg["pos"]) > 0 else PositionSide.SHORT
         else:
-            position_side = PositionSide.LONG if position_msg.get("posSide") == "long" else PositionSide.SHORT
+            position_side = _POS_SIDE_MAP.get(position_msg.get("posSide"), PositionSide.SHORT)
         return position_side
 
     @staticmethod
@@ -643,50 +712,31 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             amount = abs(notional_usd / avg_px) if notional_usd != s_decimal_0 else s_decimal_0
             return max(amount, round(amount))
         else:
-            return Decimal("0.0")
+            return s_decimal_0
 
-    async def _process_account_position_event(self, position_msg: Dict[str, Any]):
+    def _process_account_position_event(self, position_msg: Dict[str, Any]):
         """
         Updates position
         :param position_msg: The position event message payload
         """
         if bool(position_msg.get("instId")):
             ex_trading_pair = position_msg["instId"]
-            trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=ex_trading_pair)
+            trading_pair = self._trading_pair_for_exchange_symbol(ex_trading_pair)
             position_side = self.get_position_side(position_msg)
-            entry_price = Decimal(position_msg["avgPx"]) if bool(position_msg["avgPx"]) else Decimal("0")
+            entry_price = Decimal(position_msg["avgPx"]) if bool(position_msg["avgPx"]) else s_decimal_0
             amount = self.get_position_amount(position_msg)
-            leverage = Decimal(position_msg["lever"]) if bool(position_msg["lever"]) else Decimal("0")
-            unrealized_pnl = Decimal(position_msg["upl"]) if bool(position_msg["upl"]) else Decimal("0")
-            pos_key = self._perpetual_trading.position_key(trading_pair, position_side)
-            if amount != s_decimal_0:
-                position = Position(
-                    trading_pair=trading_pair,
-                    position_side=position_side,
-                    unrealized_pnl=unrealized_pnl,
-                    entry_price=entry_price,
-                    amount=amount * (Decimal("-1.0") if position_side == PositionSide.SHORT else Decimal("1.0")),
-                    leverage=leverage,
-                )
-                self._perpetual_trading.set_position(pos_key, position)
-            else:
-                self._perpetual_trading.remove_position(pos_key)
+            leverage = Decimal(position_msg["lever"]) if bool(position_msg["lever"]) else s_decimal_0
+            unrealized_pnl = Decimal(position_msg["upl"]) if bool(position_msg["upl"]) else s_decimal_0
+            self._set_or_remove_position(
+                trading_pair=trading_pair,
+                position_side=position_side,
+                unrealized_pnl=unrealized_pnl,
+                entry_price=entry_price,
+                amount=amount,
+                leverage=leverage,
+            )
             # safe_ensure_future(self._update_balances())
 
-    def _process_trade_event_message(self, trade_msg: Dict[str, Any]):
-        """
-        Updates in-flight order and trigger order filled event for trade message received. Triggers order completed
-        event if the total executed amount equals to the specified order amount.
-        :param trade_msg: The trade event message payload
-        """
-
-        client_order_id = str(trade_msg["clOrdId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-
-        if fillable_order is not None:
-            trade_update = self._parse_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
-            self._order_tracker.process_trade_update(trade_update)
-
     def _process_order_event_message(self, order_msg: Dict[str, Any]):
         """
         Updates in-flight order and triggers cancellation or failure event if needed.
@@ -695,7 +745,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         client_order_id = order_msg["clOrdId"]
         order_status = CONSTANTS.ORDER_STATE[order_msg["state"]]
         trade_type = TradeType.BUY if order_msg["side"] == "buy" else TradeType.SELL
-        position_side = PositionSide.LONG if order_msg["posSide"] == "long" else PositionSide.SHORT
+        position_side = _POS_SIDE_MAP.get(order_msg["posSide"], PositionSide.SHORT)
         position_action = (PositionAction.OPEN
                            if (trade_type == TradeType.BUY and position_side == PositionSide.LONG) or
                               (trade_type == TradeType.SELL and position_side == PositionSide.SHORT)
@@ -703,8 +753,11 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         fill_fee_currency = order_msg.get("fillFeeCcy")
         fill_fee = -Decimal(order_msg.get("fillFee", "0"))
 
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
-        if updatable_order is not None:
+        order_tracker = self._order_tracker
+        updatable_order = order_tracker.all_updatable_orders.get(client_order_id)
+        # Reprints of an unchanged state (e.g. successive partial fills) carry nothing new for the order itself
+        if updatable_order is not None and (updatable_order.current_state != order_status
+                                            or updatable_order.exchange_order_id is None):
             new_order_update: OrderUpdate = OrderUpdate(
                 trading_pair=updatable_order.trading_pair,
                 update_timestamp=self.current_timestamp,
@@ -712,11 +765,12 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
                 client_order_id=client_order_id,
                 exchange_order_id=order_msg["ordId"],
             )
-            self._order_tracker.process_order_update(new_order_update)
+            order_tracker.process_order_update(new_order_update)
 
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = order_tracker.all_fillable_orders.get(client_order_id)
         if fillable_order is not None and order_status in [OrderState.PARTIALLY_FILLED, OrderState.FILLED]:
-            fill_base_amount = abs(self._format_size_to_amount(fillable_order.trading_pair, (Decimal(str(order_msg["fillSz"])))))
+            fill_base_amount = abs(self._format_size_to_amount(fillable_order.trading_pair, Decimal(order_msg["fillSz"])))
+            fill_price = Decimal(order_msg["fillPx"])
             fee = TradeFeeBase.new_perpetual_fee(
                 fee_schema=self.trade_fee_schema(),
                 position_action=position_action,
@@ -730,11 +784,11 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
                 trading_pair=fillable_order.trading_pair,
                 fee=fee,
                 fill_base_amount=fill_base_amount,
-                fill_quote_amount=fill_base_amount * Decimal(order_msg["fillPx"]),
-                fill_price=Decimal(order_msg["fillPx"]),
+                fill_quote_amount=fill_base_amount * fill_price,
+                fill_price=fill_price,
                 fill_timestamp=int(order_msg["uTime"]),
             )
-            self._order_tracker.process_trade_update(trade_update)
+            order_tracker.process_trade_update(trade_update)
 
     def _process_wallet_event_message(self, wallet_msg: Dict[str, Any]):
         """
@@ -745,17 +799,52 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             self._update_balance_from_details(balance_details=balance_detail)
 
     async def _make_trading_rules_request(self) -> Any:
-        params = {"instType": "SWAP"}
-        exchange_info = await self._api_get(path_url=self.trading_rules_request_path, params=params)
+        exchange_info = await self._api_get(path_url=self.trading_rules_request_path, params=_SWAP_PARAMS)
         return exchange_info
 
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
-        mapping = bidict()
-        for symbol_data in filter(okx_utils.is_exchange_information_valid, exchange_info["data"]):
-            mapping[symbol_data["instId"]] = combine_to_hb_trading_pair(base=symbol_data["ctValCcy"],
-                                                                        quote=symbol_data["settleCcy"])
+        mapping = bidict({
+            symbol_data["instId"]: combine_to_hb_trading_pair(base=symbol_data["ctValCcy"], quote=symbol_data["settleCcy"])
+            for symbol_data in exchange_info["data"]
+            if okx_utils.is_exchange_information_valid(symbol_data)
+        })
         self._set_trading_pair_symbol_map(mapping)
 
+    def _set_trading_pair_symbol_map(self, trading_pair_and_symbol_map: Optional[Mapping[str, str]]):
+        super()._set_trading_pair_symbol_map(trading_pair_and_symbol_map)
+        # Plain dict snapshots of both directions of the map, so hot paths can resolve symbols without awaiting
+        self._symbol_to_trading_pair = dict(trading_pair_and_symbol_map or {})
+        self._symbol_cache = {
+            trading_pair: exchange_symbol for exchange_symbol, trading_pair in self._symbol_to_trading_pair.items()
+        }
+
+    def _exchange_symbol_for_pair(self, trading_pair: str) -> str:
+        exchange_symbol = self._symbol_cache.get(trading_pair)
+        if exchange_symbol is None:
+            exchange_symbol = f"{trading_pair}-SWAP"
+        return exchange_symbol
+
+    def _trading_pair_for_exchange_symbol(self, symbol: str) -> str:
+        trading_pair = self._symbol_to_trading_pair.get(symbol)
+        if trading_pair is None:
+            trading_pair = symbol.removesuffix("-SWAP")
+        return trading_pair
+
+    async def _execute_set_position_mode_for_pairs(
+        self, mode: PositionMode, trading_pairs: List[str]
+    ) -> Tuple[bool, List[str], str]:
+        # OKX position mode is an account level setting, so one request covers all trading pairs
+        success = True
+        msg = ""
+
+        if len(trading_pairs) > 0 and mode != self._perpetual_trading.position_mode:
+            success, msg = await self._trading_pair_position_mode_set(mode, trading_pairs[0])
+        if not success:
+            for trading_pair in trading_pairs:
+                self.logger().network(f"Error switching {trading_pair} mode to {mode}: {msg}")
+
+        return success, list(trading_pairs) if success else [], msg
+
     async def _trading_pair_position_mode_set(self, mode: PositionMode, trading_pair: str) -> Tuple[bool, str]:
         msg = ""
         success = True
@@ -780,7 +869,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         return success, msg
 
     async def _set_trading_pair_leverage(self, trading_pair: str, leverage: int) -> Tuple[bool, str]:
-        exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair)
+        exchange_symbol = self._exchange_symbol_for_pair(trading_pair)
         success = False
         msg = ""
 
@@ -805,10 +894,10 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         return success, msg
 
     async def trading_pair_associated_to_exchange_symbol(self, symbol: str):
-        return symbol.rstrip("-SWAP")
+        return self._trading_pair_for_exchange_symbol(symbol)
 
     async def exchange_symbol_associated_to_pair(self, trading_pair: str):
-        return f"{trading_pair}-SWAP"
+        return self._exchange_symbol_for_pair(trading_pair)
 
     async def _fetch_last_fee_payment(self, trading_pair: str) -> Tuple[int, Decimal, Decimal]:
         """
@@ -832,17 +921,18 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             trading_pair=trading_pair,
         )
         data: List[Dict[str, Any]] = raw_response.get("data")
-        ex_trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair)
+        ex_trading_pair = self._exchange_symbol_for_pair(trading_pair)
         trading_pair_data = [bill for bill in data if bill["instId"] == ex_trading_pair]
-        payment = Decimal("-1")
         if not trading_pair_data:
             # An empty funding fee/payment is retrieved.
-            timestamp, funding_rate = 0, Decimal("-1")
-        else:
-            timestamp: int = int(trading_pair_data[0]["ts"])
-            funding_rate: Decimal = self._orderbook_ds._last_rate if self._orderbook_ds._last_rate is not None else Decimal(str(-1))
-            if trading_pair_data[0].get("type") == CONSTANTS.FUNDING_PAYMENT_TYPE:
-                payment: Decimal = Decimal(str(trading_pair_data[0]["pnl"]))
+            return 0, s_decimal_neg_one, s_decimal_neg_one
+
+        timestamp: int = int(trading_pair_data[0]["ts"])
+        last_rate = self._orderbook_ds._last_rate
+        funding_rate: Decimal = last_rate if last_rate is not None else s_decimal_neg_one
+        payment = s_decimal_neg_one
+        if trading_pair_data[0].get("type") == CONSTANTS.FUNDING_PAYMENT_TYPE:
+            payment = Decimal(trading_pair_data[0]["pnl"])
 
         return timestamp, funding_rate, payment
 
@@ -855,17 +945,24 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
                            return_err: bool = False,
                            limit_id: Optional[str] = None,
                            trading_pair: Optional[str] = None,
+                           headers: Optional[Dict[str, Any]] = None,
                            **kwargs) -> Dict[str, Any]:
 
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
         if limit_id is None:
-            limit_id = web_utils.get_rest_api_limit_id_for_endpoint(
-                method=method.value,
-                endpoint=path_url,
-            )
-        url = web_utils.get_rest_url_for_endpoint(endpoint=path_url, domain=self._domain)
+            limit_id = self._limit_id_by_method_and_path.get((method.value, path_url))
+            if limit_id is None:
+                limit_id = web_utils.get_rest_api_limit_id_for_endpoint(
+                    method=method.value,
+                    endpoint=path_url,
+                )
+                self._limit_id_by_method_and_path[(method.value, path_url)] = limit_id
+        url = self._rest_url_by_path.get(path_url)
+        if url is None:
+            url = web_utils.get_rest_url_for_endpoint(endpoint=path_url, domain=self._domain)
+            self._rest_url_by_path[path_url] = url
 
-        resp = await rest_assistant.execute_request(
+        response = await rest_assistant.execute_request_and_get_response(
             url=url,
             params=params,
             data=data,
@@ -873,8 +970,10 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             is_auth_required=is_auth_required,
             return_err=return_err,
             throttler_limit_id=limit_id if limit_id else path_url,
+            headers=headers,
         )
-        return resp
+        # ujson decodes the large instruments and fills payloads noticeably faster than the stdlib parser
+        return ujson.loads(await response.text())
 
     @staticmethod
     def _format_ret_code_for_print(ret_code: Union[str, int]) -> str:
@@ -3,7 +3,8 @@ import importlib
 import inspect
 import os
 from decimal import Decimal
-from typing import Callable, Dict, List, Optional, Set
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 import yaml
@@ -11,7 +12,7 @@ from pydantic import Field, validator
 
 from hummingbot.client import settings
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientFieldData
-from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.client.ui.interface_utils import format_rows_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionMode
@@ -25,7 +26,6 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
 )
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
 from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator
-from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import (
     CreateExecutorAction,
     ExecutorAction,
@@ -35,6 +35,41 @@ from hummingbot.strategy_v2.models.executor_actions import (
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
+def _parse_markets_str(v: str) -> Dict[str, Set[str]]:
+    markets_dict = {}
+    if v.strip():
+        for exchange in v.split(':'):
+            exchange_name, separator, trading_pairs = exchange.partition('.')
+            if not separator or not trading_pairs or '.' in trading_pairs:
+                raise ValueError(f"Invalid market format in segment '{exchange}'. "
+                                 "Expected format: 'exchange.tp1,tp2'")
+            markets_dict[exchange_name] = set(trading_pairs.split(','))
+    return markets_dict
+
+
+def _parse_candles_config_str(v: str) -> List[CandlesConfig]:
+    configs = []
+    if v.strip():
+        for entry in v.split(':'):
+            parts = entry.split('.')
+            if len(parts) != 4:
+                raise ValueError(f"Invalid candles config format in segment '{entry}'. "
+                                 "Expected format: 'exchange.tradingpair.interval.maxrecords'")
+            connector, trading_pair, interval, max_records_str = parts
+            try:
+                max_records = int(max_records_str)
+            except ValueError:
+                raise ValueError(f"Invalid max_records value '{max_records_str}' in segment '{entry}'. "
+                                 "max_records should be an integer.")
+            configs.append(CandlesConfig(
+                connector=connector,
+                trading_pair=trading_pair,
+                interval=interval,
+                max_records=max_records
+            ))
+    return configs
+
+
 class StrategyV2ConfigBase(BaseClientModel):
     """
     Base class for version 2 strategy configurations.
@@ -116,57 +151,26 @@ class StrategyV2ConfigBase(BaseClientModel):
     @validator('markets', pre=True)
     def parse_markets(cls, v) -> Dict[str, Set[str]]:
         if isinstance(v, str):
-            return cls.parse_markets_str(v)
+            return _parse_markets_str(v)
         elif isinstance(v, dict):
             return v
         raise ValueError("Invalid type for markets. Expected str or Dict[str, Set[str]]")
 
     @staticmethod
     def parse_markets_str(v: str) -> Dict[str, Set[str]]:
-        markets_dict = {}
-        if v.strip():
-            exchanges = v.split(':')
-            for exchange in exchanges:
-                parts = exchange.split('.')
-                if len(parts) != 2 or not parts[1]:
-                    raise ValueError(f"Invalid market format in segment '{exchange}'. "
-                                     "Expected format: 'exchange.tp1,tp2'")
-                exchange_name, trading_pairs = parts
-                markets_dict[exchange_name] = set(trading_pairs.split(','))
-        return markets_dict
+        return _parse_markets_str(v)
 
     @validator('candles_config', pre=True)
     def parse_candles_config(cls, v) -> List[CandlesConfig]:
         if isinstance(v, str):
-            return cls.parse_candles_config_str(v)
+            return _parse_candles_config_str(v)
         elif isinstance(v, list):
             return v
         raise ValueError("Invalid type for candles_config. Expected str or List[CandlesConfig]")
 
     @staticmethod
     def parse_candles_config_str(v: str) -> List[CandlesConfig]:
-        configs = []
-        if v.strip():
-            entries = v.split(':')
-            for entry in entries:
-                parts = entry.split('.')
-                if len(parts) != 4:
-                    raise ValueError(f"Invalid candles config format in segment '{entry}'. "
-                                     "Expected format: 'exchange.tradingpair.interval.maxrecords'")
-                connector, trading_pair, interval, max_records_str = parts
-                try:
-                    max_records = int(max_records_str)
-                except ValueError:
-                    raise ValueError(f"Invalid max_records value '{max_records_str}' in segment '{entry}'. "
-                                     "max_records should be an integer.")
-                config = CandlesConfig(
-                    connector=connector,
-                    trading_pair=trading_pair,
-                    interval=interval,
-                    max_records=max_records
-                )
-                configs.append(config)
-        return configs
+        return _parse_candles_config_str(v)
 
 
 class StrategyV2Base(ScriptStrategyBase):
@@ -177,6 +181,10 @@ class StrategyV2Base(ScriptStrategyBase):
     _last_config_update_ts: float = 0
     closed_executors_buffer: int = 100
     max_executors_close_attempts: int = 10
+    # Controller class resolved for each controller config module, shared by every strategy instance
+    _controller_class_cache: Dict[str, type] = {}
+    _COLUMNS_TO_SHOW = ("type", "side", "status", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote",
+                        "filled_amount_quote", "is_trading", "close_type", "age")
 
     @classmethod
     def init_markets(cls, config: StrategyV2ConfigBase):
@@ -198,6 +206,13 @@ class StrategyV2Base(ScriptStrategyBase):
 
         self.executors_info: Dict[str, List[ExecutorInfo]] = {}
         self.positions_held: Dict[str, List] = {}
+        # Set when the executors info must be refreshed even if no executor is running, e.g. after executing actions
+        self._executors_dirty: bool = True
+        # Bumped whenever the executors info or the controllers change. Together with the tick timestamp it keys the
+        # last format_status output, so repeated status calls within the same tick reuse it
+        self._status_version: int = 0
+        self._cached_status_key: Optional[Tuple[int, float]] = None
+        self._cached_status: Optional[str] = None
 
         # Create a queue to listen to actions from the controllers
         self.actions_queue = asyncio.Queue()
@@ -221,9 +236,15 @@ class StrategyV2Base(ScriptStrategyBase):
 
     def add_controller(self, config: ControllerConfigBase):
         try:
-            controller = config.get_controller_class()(config, self.market_data_provider, self.actions_queue)
+            controller_class = self._controller_class_cache.get(config.__module__)
+            if controller_class is None:
+                controller_class = config.get_controller_class()
+                self._controller_class_cache[config.__module__] = controller_class
+            controller = controller_class(config, self.market_data_provider, self.actions_queue)
             controller.start()
             self.controllers[config.id] = controller
+            self._status_version += 1
+            self._executors_dirty = True
         except Exception as e:
             self.logger().error(f"Error adding controller: {e}", exc_info=True)
 
@@ -246,13 +267,25 @@ class StrategyV2Base(ScriptStrategyBase):
         """
         while True:
             try:
-                actions = await self.actions_queue.get()
-                self.executor_orchestrator.execute_actions(actions)
+                # Execute every batch of actions already queued before refreshing the executors info once
+                actions_batches = [await self.actions_queue.get()]
+                while True:
+                    try:
+                        actions_batches.append(self.actions_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                updated_controller_ids = set()
+                for actions in actions_batches:
+                    try:
+                        self.executor_orchestrator.execute_actions(actions)
+                        updated_controller_ids.add(actions[0].controller_id)
+                    except Exception as e:
+                        self.logger().error(f"Error executing action: {e}", exc_info=True)
                 self.update_executors_info()
-                controller_id = actions[0].controller_id
-                controller = self.controllers.get(controller_id)
-                controller.executors_info = self.executors_info.get(controller_id, [])
-                controller.executors_update_event.set()
+                for controller_id in updated_controller_ids:
+                    controller = self.controllers.get(controller_id)
+                    controller.executors_info = self.executors_info.get(controller_id, [])
+                    controller.executors_update_event.set()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -267,6 +300,8 @@ class StrategyV2Base(ScriptStrategyBase):
         try:
             self.executors_info = self.executor_orchestrator.get_executors_report()
             self.positions_held = self.executor_orchestrator.get_positions_report()
+            self._status_version += 1
+            self._executors_dirty = False
             for controllers in self.controllers.values():
                 controllers.executors_info = self.executors_info.get(controllers.config.id, [])
                 controllers.positions_held = self.positions_held.get(controllers.config.id, [])
@@ -285,18 +320,29 @@ class StrategyV2Base(ScriptStrategyBase):
         for controller in self.controllers.values():
             controller.stop()
         for i in range(self.max_executors_close_attempts):
-            if all([executor.is_done for executor in self.get_all_executors()]):
+            if all(executor.is_done for executor in self.iter_all_executors()):
                 continue
             await asyncio.sleep(5.0)
         self.executor_orchestrator.store_all_executors()
 
     def on_tick(self):
-        self.update_executors_info()
+        if self._executors_dirty or self._executors_info_may_change():
+            self.update_executors_info()
         self.update_controllers_configs()
         if self.market_data_provider.ready and not self._is_stop_triggered:
             executor_actions: List[ExecutorAction] = self.determine_executor_actions()
             for action in executor_actions:
                 self.executor_orchestrator.execute_action(action)
+            if len(executor_actions) > 0:
+                self._executors_dirty = True
+
+    def _executors_info_may_change(self) -> bool:
+        """
+        Running executors update their info on their own and held positions are valued at the current mid price, so
+        while there are any of them the executors info has to be refreshed on every tick.
+        """
+        return (any(len(executors) > 0 for executors in self.executor_orchestrator.active_executors.values())
+                or any(len(positions) > 0 for positions in self.executor_orchestrator.positions_held.values()))
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
         """
@@ -337,7 +383,10 @@ class StrategyV2Base(ScriptStrategyBase):
         return self.executors_info.get(controller_id, [])
 
     def get_all_executors(self) -> List[ExecutorInfo]:
-        return [executor for executors in self.executors_info.values() for executor in executors]
+        return list(self.iter_all_executors())
+
+    def iter_all_executors(self) -> Iterator[ExecutorInfo]:
+        return chain.from_iterable(self.executors_info.values())
 
     def set_leverage(self, connector: str, trading_pair: str, leverage: int):
         self.connectors[connector].set_leverage(trading_pair, leverage)
@@ -354,21 +403,33 @@ class StrategyV2Base(ScriptStrategyBase):
         """
         Convert a list of executor handler info to a dataframe.
         """
-        df = pd.DataFrame([ei.to_dict() for ei in executors_info])
-        # Convert the enum values to integers
-        df['status'] = df['status'].apply(lambda x: x.value)
-
-        # Sort the DataFrame
-        df.sort_values(by='status', ascending=True, inplace=True)
-
-        # Convert back to enums for display
-        df['status'] = df['status'].apply(RunnableStatus)
+        # Read the fields directly instead of serializing every executor (and its config) with to_dict()
+        columns = {field: [getattr(ei, field) for ei in executors_info] for field in ExecutorInfo.__fields__}
+        columns["side"] = [ei.side for ei in executors_info]
+        df = pd.DataFrame(columns)
+
+        # Sort by the integer value of the status enum
+        df["status_value"] = [status.value for status in columns["status"]]
+        df.sort_values(by="status_value", ascending=True, inplace=True, kind="stable")
+        df.drop(columns="status_value", inplace=True)
         return df
 
+    def _executors_rows(self, executors_info: List[ExecutorInfo]) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Build the headers and rows of the executors status table, sorted by the integer value of the status enum.
+        """
+        headers = list(self._COLUMNS_TO_SHOW)
+        rows = [
+            tuple(self.current_timestamp - ei.timestamp if column == "age" else getattr(ei, column) for column in headers)
+            for ei in sorted(executors_info, key=lambda ei: ei.status.value)
+        ]
+        return headers, rows
+
     def format_status(self) -> str:
+        status_key = (self._status_version, self.current_timestamp)
+        if self._cached_status is not None and self._cached_status_key == status_key:
+            return self._cached_status
         original_info = super().format_status()
-        columns_to_show = ["type", "side", "status", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote",
-                           "filled_amount_quote", "is_trading", "close_type", "age"]
         extra_info = []
 
         # Initialize global performance metrics
@@ -387,9 +448,8 @@ class StrategyV2Base(ScriptStrategyBase):
             #     extra_info.append("No executors found.")
             # else:
             #     # In memory executors info
-            #     executors_df = self.executors_info_to_df(executors_list)
-            #     executors_df["age"] = self.current_timestamp - executors_df["timestamp"]
-            #     extra_info.extend([format_df_for_printout(executors_df[columns_to_show], table_format="psql")])
+            #     headers, rows = self._executors_rows(executors_list)
+            #     extra_info.append(format_rows_for_printout(rows, headers=headers, table_format="psql"))
 
             # Generate performance report for each controller
             performance_report = self.executor_orchestrator.generate_performance_report(controller_id)
@@ -444,9 +504,8 @@ class StrategyV2Base(ScriptStrategyBase):
         main_executors_list = self.get_executors_by_controller("main")
         if len(main_executors_list) > 0:
             extra_info.append("\n\nMain Controller Executors:")
-            main_executors_df = self.executors_info_to_df(main_executors_list)
-            main_executors_df["age"] = self.current_timestamp - main_executors_df["timestamp"]
-            extra_info.extend([format_df_for_printout(main_executors_df[columns_to_show], table_format="psql")])
+            headers, rows = self._executors_rows(main_executors_list)
+            extra_info.append(format_rows_for_printout(rows, headers=headers, table_format="psql"))
             main_performance_report = self.executor_orchestrator.generate_performance_report("main")
             # Aggregate global metrics and close type counts
             global_realized_pnl_quote += main_performance_report.realized_pnl_quote
@@ -474,4 +533,7 @@ class StrategyV2Base(ScriptStrategyBase):
 
         # Combine original and extra information
         format_status = f"{original_info}\n\n" + "\n".join(extra_info)
+        if self.ready_to_trade:
+            self._cached_status = format_status
+            self._cached_status_key = status_key
         return format_status
@@ -9,6 +9,7 @@ import pandas as pd
 from hummingbot.client.ui.interface_utils import (
     format_bytes,
     format_df_for_printout,
+    format_rows_for_printout,
     start_process_monitor,
     start_timer,
     start_trade_monitor,
@@ -212,6 +213,19 @@ class InterfaceUtilsTest(unittest.TestCase):
 
         self.assertEqual(target_str, df_str)
 
+    def test_format_rows_for_printout(self):
+        rows_str = format_rows_for_printout([(1, "12345"), (2, "67890")], headers=["first", "second"], table_format="psql")
+        target_str = (
+            "+---------+----------+"
+            "\n|   first |   second |"
+            "\n|---------+----------|"
+            "\n|       1 |    12345 |"
+            "\n|       2 |    67890 |"
+            "\n+---------+----------+"
+        )
+
+        self.assertEqual(target_str, rows_str)
+
     def test_format_df_for_printout_table_format_from_global_config(self):
         df = pd.DataFrame(
             data={
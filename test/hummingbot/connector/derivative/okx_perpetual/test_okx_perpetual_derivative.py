@@ -3,7 +3,7 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 from aioresponses import aioresponses
@@ -19,7 +19,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -734,6 +734,7 @@ class OkxPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDeri
 
     def validate_order_creation_request(self, order: InFlightOrder, request_call: RequestCall):
         self._simulate_trading_rules_initialized()
+        self.assertEqual(CONSTANTS.HBOT_BROKER_ID, request_call.kwargs["headers"]["referer"])
         request_data = json.loads(request_call.kwargs["data"])
         self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
                          request_data["instId"])
@@ -1225,10 +1226,12 @@ class OkxPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDeri
         )
         response = self._order_fills_request_full_fill_mock_response(self.exchange.in_flight_orders["11"])
         url = web_utils.get_rest_url_for_endpoint(CONSTANTS.REST_USER_TRADE_RECORDS[CONSTANTS.ENDPOINT])
-        url = f"{url}?instId={self.exchange_trading_pair}&limit=100"
-        regex_url = re.compile(f"^{url}")
+        url = f"{url}?instType=SWAP&limit=100"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
         mock_api.get(regex_url, body=json.dumps(response))
         asyncio.get_event_loop().run_until_complete(self.exchange._update_trade_history())
+        # A single request is sent for all the trading pairs
+        self.assertEqual(1, len(mock_api.requests))
         # Assert that self._trading_pairs is not empty
         self.assertNotEqual(len(self.exchange._trading_pairs), 0, "No trading pairs fetched")
 
@@ -1247,6 +1250,72 @@ class OkxPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDeri
     def trade_event_for_full_fill_websocket_update(self, order: InFlightOrder):
         return {}
 
+    @aioresponses()
+    def test_update_trade_history_pages_through_fills_of_other_instruments(self, mock_api):
+        self.exchange.start_tracking_order(
+            order_id="11",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        tracked_fill = self._order_fills_request_full_fill_mock_response(self.exchange.in_flight_orders["11"])["data"][0]
+        other_fills = [
+            dict(tracked_fill, instId="BTC-USDT-SWAP", clOrdId=f"other{i}", billId=str(2000 - i), ts=str(1597026400000 - i))
+            for i in range(100)
+        ]
+        url = web_utils.get_rest_url_for_endpoint(CONSTANTS.REST_USER_TRADE_RECORDS[CONSTANTS.ENDPOINT])
+        regex_url = re.compile(f"^{url}".replace(".", r"\.") + r"\?.*")
+        mock_api.get(regex_url, body=json.dumps({"code": "0", "msg": "", "data": other_fills}))
+        mock_api.get(regex_url, body=json.dumps({"code": "0", "msg": "", "data": [tracked_fill]}))
+
+        self.async_run_with_timeout(self.exchange._update_trade_history())
+
+        requests = self._all_executed_requests(mock_api, regex_url)
+        self.assertEqual(2, len(requests))
+        self.assertNotIn("after", requests[0].kwargs["params"])
+        self.assertEqual("1901", requests[1].kwargs["params"]["after"])
+        self.assertEqual(Decimal("100"), self.exchange.in_flight_orders["11"].executed_amount_base)
+        self.assertEqual(1597026400.0, self.exchange._last_trade_history_timestamp)
+
+    def test_position_event_updates_existing_position_in_place(self):
+        self.exchange._perpetual_trading.set_position_mode(PositionMode.HEDGE)
+        position_msg = {
+            "instId": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "posSide": "short",
+            "pos": "-10",
+            "avgPx": "100",
+            "notionalUsd": "1000",
+            "lever": "5",
+            "upl": "1",
+        }
+        self.exchange._process_account_position_event(position_msg)
+        position = self.exchange.account_positions[f"{self.trading_pair}SHORT"]
+
+        self.exchange._process_account_position_event(dict(position_msg, notionalUsd="2000", upl="-3"))
+
+        self.assertIs(position, self.exchange.account_positions[f"{self.trading_pair}SHORT"])
+        self.assertEqual(Decimal("-20"), position.amount)
+        self.assertEqual(Decimal("-3"), position.unrealized_pnl)
+        self.assertEqual(Decimal("5"), position.leverage)
+
+        self.exchange._process_account_position_event(dict(position_msg, notionalUsd="", upl=""))
+
+        self.assertNotIn(f"{self.trading_pair}SHORT", self.exchange.account_positions)
+
+    def test_trading_pair_associated_to_exchange_symbol_only_removes_swap_suffix(self):
+        trading_pair = self.async_run_with_timeout(
+            self.exchange.trading_pair_associated_to_exchange_symbol(
+                self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)))
+        self.assertEqual(self.trading_pair, trading_pair)
+
+        # Symbols missing from the symbol map keep every character of their quote asset
+        trading_pair = self.async_run_with_timeout(
+            self.exchange.trading_pair_associated_to_exchange_symbol("BTC-USDP-SWAP"))
+        self.assertEqual("BTC-USDP", trading_pair)
+
     @aioresponses()
     def test_update_positions(self, mock_api):
         amount = Decimal("100")
@@ -1261,10 +1330,13 @@ class OkxPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDeri
         )
         response = self.position_event_for_full_fill_websocket_update(self.exchange.in_flight_orders["11"], 0.1)
         url = web_utils.get_rest_url_for_endpoint(CONSTANTS.REST_GET_POSITIONS[CONSTANTS.ENDPOINT])
-        url = f"{url}?instId={self.exchange_trading_pair}"
-        regex_url = re.compile(f"^{url}")
+        url = f"{url}?instType=SWAP"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
         mock_api.get(regex_url, body=json.dumps(response))
         asyncio.get_event_loop().run_until_complete(self.exchange._update_positions())
+        # A single request is sent for all the trading pairs
+        self.assertEqual(1, len(mock_api.requests))
+        self.assertEqual(1, len(self.exchange.account_positions))
         # Assert that self._trading_pairs is not empty
         self.assertNotEqual(len(self.exchange._trading_pairs), 0, "No trading pairs fetched")
 
@@ -2346,6 +2418,115 @@ class OkxPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDeri
 
         self.assertEqual(1, self.exchange._order_tracker._order_not_found_records[order.client_order_id])
 
+    def test_update_orders_processes_each_order_status_without_waiting_for_slower_requests(self):
+        self.exchange._set_current_timestamp(1640780000)
+
+        for order_number in ("1", "2"):
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + order_number,
+                exchange_order_id="10023" + order_number,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        slow_order = self.exchange.in_flight_orders[self.client_order_id_prefix + "1"]
+        fast_order = self.exchange.in_flight_orders[self.client_order_id_prefix + "2"]
+        fast_order_processed = asyncio.Event()
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            if tracked_order is slow_order:
+                # Only completes once the other order update was already processed
+                await fast_order_processed.wait()
+                raise IOError("Order does not exist")
+            fast_order_processed.set()
+            return OrderUpdate(
+                client_order_id=tracked_order.client_order_id,
+                exchange_order_id=tracked_order.exchange_order_id,
+                trading_pair=tracked_order.trading_pair,
+                update_timestamp=1640780000,
+                new_state=OrderState.CANCELED,
+            )
+
+        with patch.object(self.exchange, "_request_order_status", side_effect=request_order_status):
+            self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertNotIn(fast_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertTrue(slow_order.is_open)
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records[slow_order.client_order_id])
+
+    def test_set_position_mode_sends_one_request_for_all_trading_pairs(self):
+        trading_pairs = [self.trading_pair, "BTC-USDT"]
+
+        with patch.object(self.exchange, "_trading_pair_position_mode_set",
+                          new=AsyncMock(return_value=(True, ""))) as position_mode_set:
+            success, successful_pairs, _ = self.async_run_with_timeout(
+                self.exchange._execute_set_position_mode_for_pairs(PositionMode.HEDGE, trading_pairs))
+
+        position_mode_set.assert_awaited_once_with(PositionMode.HEDGE, self.trading_pair)
+        self.assertTrue(success)
+        self.assertEqual(trading_pairs, successful_pairs)
+
+    def test_order_event_with_unchanged_state_skips_order_update(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id=self.client_order_id_prefix + "1",
+            exchange_order_id=str(self.expected_exchange_order_id),
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        order = self.exchange.in_flight_orders[self.client_order_id_prefix + "1"]
+        order.current_state = OrderState.OPEN
+        order_event = self.order_event_for_new_order_websocket_update(order)
+
+        with patch.object(self.exchange._order_tracker, "process_order_update") as process_order_update:
+            self.exchange._process_order_event_message(order_event["data"][0])
+
+        process_order_update.assert_not_called()
+        self.assertTrue(order.is_open)
+
+    def test_update_orders_cancels_pending_order_status_requests_when_cancelled(self):
+        self.exchange._set_current_timestamp(1640780000)
+
+        for order_number in ("1", "2"):
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + order_number,
+                exchange_order_id="10023" + order_number,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        requests_started = []
+        requests_cancelled = []
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            requests_started.append(tracked_order.client_order_id)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                requests_cancelled.append(tracked_order.client_order_id)
+                raise
+
+        async def cancel_update_orders():
+            update_task = asyncio.ensure_future(self.exchange._update_orders())
+            while len(requests_started) < 2:
+                await asyncio.sleep(0)
+            update_task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await update_task
+            await asyncio.sleep(0)
+
+        with patch.object(self.exchange, "_request_order_status", side_effect=request_order_status):
+            self.async_run_with_timeout(cancel_update_orders())
+
+        self.assertEqual(sorted(requests_started), sorted(requests_cancelled))
+
     @aioresponses()
     def test_create_order_to_close_short_position(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -7,6 +7,7 @@ import pandas as pd
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.ui.interface_utils import format_df_for_printout, format_rows_for_printout
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
@@ -57,6 +58,26 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         self.assertIn(self.connector_name, StrategyV2Base.markets)
         self.assertIn(self.trading_pair, StrategyV2Base.markets[self.connector_name])
 
+    def test_add_controller_resolves_controller_class_once_per_module(self):
+        controller_class = MagicMock()
+        configs = []
+        for controller_id in ("controller_a", "controller_b"):
+            config = MagicMock()
+            config.id = controller_id
+            config.__module__ = "controllers.generic.test_controller"
+            config.get_controller_class.return_value = controller_class
+            configs.append(config)
+
+        with patch.dict(StrategyV2Base._controller_class_cache, clear=True):
+            for config in configs:
+                self.strategy.add_controller(config)
+
+        self.assertEqual(1, configs[0].get_controller_class.call_count)
+        configs[1].get_controller_class.assert_not_called()
+        self.assertEqual(2, controller_class.call_count)
+        self.assertIn("controller_a", self.strategy.controllers)
+        self.assertIn("controller_b", self.strategy.controllers)
+
     def test_store_actions_proposal(self):
         # Setup test executors with all required fields
         executor_1 = ExecutorInfo(
@@ -118,6 +139,18 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         executors = self.strategy.get_all_executors()
         self.assertEqual(len(executors), 3)
 
+    def test_iter_all_executors(self):
+        controller_1_executors = [MagicMock(), MagicMock()]
+        controller_2_executors = [MagicMock()]
+        self.strategy.executors_info = {
+            "controller_1": controller_1_executors,
+            "controller_2": controller_2_executors,
+        }
+
+        executors = self.strategy.iter_all_executors()
+        self.assertNotIsInstance(executors, list)
+        self.assertEqual(controller_1_executors + controller_2_executors, list(executors))
+
     def test_set_leverage(self):
         mock_connector = MagicMock()
         self.strategy.connectors = {"mock": mock_connector}
@@ -165,6 +198,33 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         # Since no actions are returned, execute_action should not be called
         mock_execute_action.assert_not_called()
 
+    @patch.object(StrategyV2Base, "update_controllers_configs")
+    @patch.object(StrategyV2Base, "determine_executor_actions", return_value=[])
+    async def test_on_tick_refreshes_executors_info_only_when_it_can_change(self, _, __):
+        orchestrator = self.strategy.executor_orchestrator
+        orchestrator.active_executors = {"main": []}
+        orchestrator.positions_held = {"main": []}
+
+        self.strategy.on_tick()
+        self.strategy.on_tick()
+        self.assertEqual(1, orchestrator.get_executors_report.call_count)
+
+        orchestrator.active_executors["main"].append(MagicMock())
+        self.strategy.on_tick()
+        self.strategy.on_tick()
+        self.assertEqual(3, orchestrator.get_executors_report.call_count)
+
+        orchestrator.active_executors["main"].clear()
+        orchestrator.positions_held["main"].append(MagicMock())
+        self.strategy.on_tick()
+        self.assertEqual(4, orchestrator.get_executors_report.call_count)
+
+        orchestrator.positions_held["main"].clear()
+        self.strategy._executors_dirty = True
+        self.strategy.on_tick()
+        self.strategy.on_tick()
+        self.assertEqual(5, orchestrator.get_executors_report.call_count)
+
     async def test_on_stop(self):
         await self.strategy.on_stop()
 
@@ -190,6 +250,11 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         with self.assertRaises(ValueError):
             StrategyV2ConfigBase.parse_markets_str(test_input)
 
+    def test_parse_markets_str_invalid_segments(self):
+        for test_input in ("binance.", "binance.BTC-USDT.extra", "binance.BTC-USDT:kucoin"):
+            with self.assertRaises(ValueError):
+                StrategyV2ConfigBase.parse_markets_str(test_input)
+
     def test_parse_candles_config_str_valid(self):
         test_input = "binance.JASMY-USDT.1m.500:kucoin.BTC-USDT.5m.200"
         result = StrategyV2ConfigBase.parse_candles_config_str(test_input)
@@ -284,6 +349,38 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(df.iloc[0]['status'], RunnableStatus.RUNNING)
         self.assertEqual(df.iloc[1]['status'], RunnableStatus.TERMINATED)
 
+    def test_executors_info_to_df_without_executors(self):
+        df = StrategyV2Base.executors_info_to_df([])
+
+        self.assertTrue(df.empty)
+        self.assertIn("status", df.columns)
+        self.assertIn("side", df.columns)
+        self.assertNotIn("status_value", df.columns)
+
+    def test_executors_rows_match_executors_dataframe_printout(self):
+        executors_info = [
+            ExecutorInfo(
+                id=str(i), timestamp=timestamp, status=status, config=self.get_position_config_market_short(),
+                net_pnl_pct=Decimal("0.01"), net_pnl_quote=Decimal("1.5"), cum_fees_quote=Decimal("0.1"),
+                filled_amount_quote=Decimal(100), is_active=True, is_trading=is_trading, custom_info={},
+                type="position_executor", controller_id="main",
+                close_type=CloseType.TAKE_PROFIT if status == RunnableStatus.TERMINATED else None,
+            )
+            for i, (timestamp, status, is_trading) in enumerate([(10, RunnableStatus.TERMINATED, False),
+                                                                 (20, RunnableStatus.RUNNING, True),
+                                                                 (30, RunnableStatus.RUNNING, False)])
+        ]
+        current_timestamp = 50
+        with patch.object(StrategyV2Base, "current_timestamp", new_callable=PropertyMock, return_value=current_timestamp):
+            headers, rows = self.strategy._executors_rows(executors_info)
+
+        executors_df = StrategyV2Base.executors_info_to_df(executors_info)
+        executors_df["age"] = current_timestamp - executors_df["timestamp"]
+        self.assertEqual(list(StrategyV2Base._COLUMNS_TO_SHOW), headers)
+        self.assertEqual([30, 20, 40], [row[headers.index("age")] for row in rows])
+        self.assertEqual(format_df_for_printout(executors_df[headers], table_format="psql"),
+                         format_rows_for_printout(rows, headers=headers, table_format="psql"))
+
     def create_mock_performance_report(self):
         return PerformanceReport(
             realized_pnl_quote=Decimal('100'),
@@ -343,6 +440,46 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         self.assertIn("Unrealized PNL (Quote): 50.00", status)
         self.assertIn("Global PNL (Quote): 150", status)
 
+    @patch.object(StrategyV2Base, "current_timestamp", new_callable=PropertyMock)
+    @patch("hummingbot.strategy.strategy_v2_base.ScriptStrategyBase.format_status")
+    def test_format_status_is_reused_within_the_same_tick(self, mock_super_format_status, mock_current_timestamp):
+        mock_super_format_status.return_value = "Super class status"
+        mock_current_timestamp.return_value = 1000
+        controller_mock = MagicMock()
+        controller_mock.to_format_status.return_value = ["Mock status for controller"]
+        self.strategy.controllers = {"controller_1": controller_mock}
+        self.strategy.executor_orchestrator.generate_performance_report = MagicMock(
+            return_value=self.create_mock_performance_report())
+        self.strategy.get_executors_by_controller = MagicMock(return_value=[])
+        self.strategy.ready_to_trade = True
+
+        status = self.strategy.format_status()
+        self.assertEqual(status, self.strategy.format_status())
+        self.assertEqual(1, controller_mock.to_format_status.call_count)
+
+        self.strategy.update_executors_info()
+        self.assertEqual(status, self.strategy.format_status())
+        self.assertEqual(2, controller_mock.to_format_status.call_count)
+
+        mock_current_timestamp.return_value = 1001
+        controller_mock.to_format_status.return_value = ["New status for controller"]
+        self.assertIn("New status for controller", self.strategy.format_status())
+        self.assertEqual(3, controller_mock.to_format_status.call_count)
+
+    @patch("hummingbot.strategy.strategy_v2_base.ScriptStrategyBase.format_status")
+    def test_format_status_is_not_cached_while_connectors_are_not_ready(self, mock_super_format_status):
+        mock_super_format_status.return_value = "Market connectors are not ready."
+        self.strategy.controllers = {}
+        self.strategy.executor_orchestrator.generate_performance_report = MagicMock(
+            return_value=self.create_mock_performance_report())
+        self.strategy.get_executors_by_controller = MagicMock(return_value=[])
+        self.strategy.ready_to_trade = False
+
+        self.strategy.format_status()
+        self.strategy.format_status()
+
+        self.assertEqual(2, mock_super_format_status.call_count)
+
     async def test_listen_to_executor_actions(self):
         self.strategy.actions_queue = MagicMock()
         # Simulate some actions being returned, followed by an exception to break the loop.
@@ -352,6 +489,7 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
             Exception,
             asyncio.CancelledError,
         ])
+        self.strategy.actions_queue.get_nowait = MagicMock(side_effect=asyncio.QueueEmpty)
         self.strategy.executor_orchestrator.execute_actions = MagicMock()
         controller_mock = MagicMock()
         self.strategy.controllers = {"controller_1": controller_mock}
@@ -365,6 +503,28 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         # Check assertions here to verify the actions were handled as expected.
         self.assertEqual(self.strategy.executor_orchestrator.execute_actions.call_count, 1)
 
+    async def test_listen_to_executor_actions_executes_queued_actions_before_updating_executors_info(self):
+        self.strategy.actions_queue = asyncio.Queue()
+        for controller_id in ("controller_1", "controller_2"):
+            self.strategy.actions_queue.put_nowait(
+                [CreateExecutorAction(controller_id=controller_id,
+                                      executor_config=self.get_position_config_market_short())])
+        self.strategy.executor_orchestrator.execute_actions = MagicMock()
+        self.strategy.executor_orchestrator.get_executors_report.return_value = {}
+        self.strategy.executor_orchestrator.get_positions_report.return_value = {}
+        controller_1, controller_2 = MagicMock(), MagicMock()
+        self.strategy.controllers = {"controller_1": controller_1, "controller_2": controller_2}
+
+        with patch.object(self.strategy, "update_executors_info", wraps=self.strategy.update_executors_info) as update_mock:
+            listen_task = asyncio.create_task(self.strategy.listen_to_executor_actions())
+            await asyncio.sleep(0.1)
+            listen_task.cancel()
+
+        self.assertEqual(2, self.strategy.executor_orchestrator.execute_actions.call_count)
+        update_mock.assert_called_once()
+        controller_1.executors_update_event.set.assert_called_once()
+        controller_2.executors_update_event.set.assert_called_once()
+
     def get_position_config_market_short(self):
         return PositionExecutorConfig(id="test-2", timestamp=1234567890, trading_pair="ETH-USDT",
                                       connector_name="binance",